@@ -17,17 +17,45 @@ Scope:
 import tkinter as tk
 from tkinter import messagebox, ttk
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageTk
 from io import BytesIO
 from tkintermapview import TkinterMapView
 from datetime import datetime
 import google.generativeai as genai
 import os
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 
 API_KEY = os.getenv("weather_api")
 # Requirement: API authentication via API keys
 BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+# OpenWeatherMap only updates every ~10 minutes, so reuse responses this long (seconds)
+CACHE_TTL = 120
+_weather_cache = {}  # (city_lower, url) -> (timestamp, data)
+# Local copies of the OpenWeatherMap icons, filled on first download
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+# OpenWeatherMap icon file suffix for each displayed size: "" is 50x50, "@2x" is 100x100
+ICON_SUFFIXES = {50: "", 100: "@2x"}
+
+# Shared HTTP session so repeated calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers["Connection"] = "keep-alive"
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Background workers: network fetches run here so they can overlap,
+# while all Tkinter updates stay on the main thread
+_executor = ThreadPoolExecutor(max_workers=2)
+# Two AI workers so a still-running analysis for an old search can't hold up the current one
+_ai_executor = ThreadPoolExecutor(max_workers=2)
 
 # Configure Gemini AI
 
@@ -37,42 +65,38 @@ try:
 except Exception as e:
     print(f"Error checking Gemini configuration: {e}")
 
-def analyze_weather_with_ai(weather_data, forecast_data):
-    """Use Gemini AI to analyze weather data and provide comprehensive insights with model fallback"""
-    try:
-        # Prepare current weather summary
-        current = weather_data.get('main', {})
-        weather_desc = weather_data.get('weather', [{}])[0].get('description', 'N/A')
-        city_name = weather_data.get('name', 'Unknown')
-        wind = weather_data.get('wind', {})
-        
-        # Extract comprehensive forecast information
-        forecast_summary = []
-        if forecast_data and 'list' in forecast_data:
-            for idx, f in enumerate(forecast_data['list'][:8]):  # Next 24 hours
-                dt = datetime.fromtimestamp(f['dt']).strftime('%Y-%m-%d %H:%M')
-                temp = f['main']['temp']
-                feels = f['main']['feels_like']
-                humidity = f['main']['humidity']
-                desc = f['weather'][0]['description']
-                wind_speed = f['wind']['speed']
-                forecast_summary.append(
-                    f"{dt}: {temp}°C (feels {feels}°C), {desc}, Humidity: {humidity}%, Wind: {wind_speed} m/s"
-                )
-        
-        # Build comprehensive prompt
-        prompt = f"""You are a professional meteorologist. Analyze this weather data for {city_name} and provide practical advice:
+# List of models to try in order of preference (Lite/Flash models often have better free tier availability)
+models_to_try = [
+    'gemini-2.0-flash-lite',
+    'gemini-flash-latest',
+    'gemini-2.0-flash',
+    'gemini-2.0-flash-exp'
+]
+# Model clients are reusable, so build them once instead of on every analysis
+_MODELS = [(name, genai.GenerativeModel(name)) for name in models_to_try]
+# Total time budget (seconds) shared by all model attempts in one analysis
+AI_TIMEOUT = 20
+# Don't start another model attempt with less time than this (seconds) left in the budget
+AI_MIN_ATTEMPT = 2.0
+# Advice barely changes within the hour, so reuse it for similar conditions (seconds)
+AI_CACHE_TTL = 3600
+AI_CACHE_MAX = 32
+_ai_cache = {}  # (city, hour, rounded temp, description) -> (timestamp, text)
+
+# Prompt for the AI analyst, filled in with str.format on each analysis
+_NL = "\n"
+_PROMPT_TEMPLATE = """You are a professional meteorologist. Analyze this weather data for {city_name} and provide practical advice:
 
 CURRENT CONDITIONS:
-- Temperature: {current.get('temp', 'N/A')}°C
-- Feels Like: {current.get('feels_like', 'N/A')}°C
-- Humidity: {current.get('humidity', 'N/A')}%
-- Pressure: {current.get('pressure', 'N/A')} hPa
+- Temperature: {temp}°C
+- Feels Like: {feels_like}°C
+- Humidity: {humidity}%
+- Pressure: {pressure} hPa
 - Weather: {weather_desc}
-- Wind Speed: {wind.get('speed', 'N/A')} m/s
+- Wind Speed: {wind_speed} m/s
 
 24-HOUR FORECAST:
-{chr(10).join(forecast_summary)}
+{forecast_block}
 
 Based on this complete weather data, provide expert advice on:
 1. Health and wellness impact
@@ -83,46 +107,175 @@ Based on this complete weather data, provide expert advice on:
 
 Keep your response conversational and practical, around 150-200 words."""
 
-        # List of models to try in order of preference (Lite/Flash models often have better free tier availability)
-        models_to_try = [
-            'gemini-2.0-flash-lite',
-            'gemini-flash-latest',
-            'gemini-2.0-flash',
-            'gemini-2.0-flash-exp'
-        ]
+def _store_ai_result(key, text):
+    """Cache an analysis, dropping expired entries and the oldest ones beyond AI_CACHE_MAX"""
+    now = time.time()
+    for old_key, (ts, _) in list(_ai_cache.items()):
+        if now - ts >= AI_CACHE_TTL:
+            _ai_cache.pop(old_key, None)  # pop: the other AI worker may prune too
+    _ai_cache[key] = (now, text)
+    while len(_ai_cache) > AI_CACHE_MAX:
+        _ai_cache.pop(next(iter(_ai_cache), None), None)  # Dicts keep insertion order: oldest first
+
+def analyze_weather_with_ai(weather_data, forecast_data):
+    """Use Gemini AI to analyze weather data and provide comprehensive insights with model fallback"""
+    try:
+        # Prepare current weather summary
+        current = weather_data.get('main', {})
+        weather_desc = weather_data.get('weather', [{}])[0].get('description', 'N/A')
+        city_name = weather_data.get('name', 'Unknown')
+        wind = weather_data.get('wind', {})
+        
+        # Reuse a recent analysis for the same city, hour and conditions
+        temp = current.get('temp')
+        cache_key = (city_name, datetime.now().hour,
+                     round(temp) if temp is not None else None, weather_desc)
+        cached = _ai_cache.get(cache_key)
+        if cached and time.time() - cached[0] < AI_CACHE_TTL:
+            return cached[1]
+        
+        # Extract comprehensive forecast information (next 24 hours)
+        forecast_summary = []
+        if forecast_data and 'list' in forecast_data:
+            forecast_summary = [
+                f"{datetime.fromtimestamp(f['dt']):%Y-%m-%d %H:%M}: {f['main']['temp']}°C "
+                f"(feels {f['main']['feels_like']}°C), {f['weather'][0]['description']}, "
+                f"Humidity: {f['main']['humidity']}%, Wind: {f['wind']['speed']} m/s"
+                for f in forecast_data['list'][:8]
+            ]
+        
+        # Build comprehensive prompt
+        prompt = _PROMPT_TEMPLATE.format(
+            city_name=city_name,
+            temp=current.get('temp', 'N/A'),
+            feels_like=current.get('feels_like', 'N/A'),
+            humidity=current.get('humidity', 'N/A'),
+            pressure=current.get('pressure', 'N/A'),
+            weather_desc=weather_desc,
+            wind_speed=wind.get('speed', 'N/A'),
+            forecast_block=_NL.join(forecast_summary),
+        )
 
         last_error = None
-        for model_name in models_to_try:
+        timed_out = False
+        deadline = time.monotonic() + AI_TIMEOUT
+        for model_name, model in _MODELS:
+            remaining = deadline - time.monotonic()
+            if remaining < AI_MIN_ATTEMPT:
+                timed_out = True
+                break  # Out of time, don't try the remaining models
             try:
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(prompt)
+                response = model.generate_content(
+                    prompt, request_options={"timeout": remaining}
+                )
+                _store_ai_result(cache_key, response.text)  # Only successes are cached
                 return response.text
             except Exception as e:
                 last_error = e
                 print(f"Model {model_name} failed: {e}")
                 continue  # Try next model
 
+        if timed_out:
+            return f"AI analysis timed out after {AI_TIMEOUT}s. Please try again later.\nDetails: {str(last_error)}"
+
         # If all failed
         return f"AI Analysis currently unavailable (Quota limit reached). Please try again later.\nDetails: {str(last_error)}"
 
     except Exception as e:
         return f"AI Analysis unavailable: {str(e)}"
 
-def get_all_data():
+# How often (ms) the main thread checks whether background work has finished
+_POLL_MS = 50
+
+def _when_done(futures, callback):
+    """Run callback on the Tk main thread once every future has finished.
+
+    Polls with root.after instead of waiting, so the event loop never blocks
+    and worker threads never have to call into Tk.
+    """
+    if all(f.done() for f in futures):
+        callback()
+    else:
+        root.after(_POLL_MS, _when_done, futures, callback)
+
+# Refresh state: a pending debounced job, whether a fetch is still running,
+# a counter identifying the latest refresh (older AI results are dropped)
+# and the latest AI job (cancelled if still queued when a new refresh starts)
+_pending_job = None
+_inflight = False
+_refresh_gen = 0
+_ai_future = None
+
+def _schedule_refresh(event=None, force=False):
+    """Coalesce rapid Enter/Search presses into a single refresh"""
+    global _pending_job
+    if _pending_job:
+        root.after_cancel(_pending_job)
+    _pending_job = root.after(150, get_all_data, force)
+
+def _force_refresh(event=None):
+    """Shift+Enter / Shift+click: refresh while bypassing the response cache"""
+    _schedule_refresh(force=True)
+    return "break"  # Stop the button's normal click from also firing
+
+def get_all_data(force=False):
     """Fetch and display both current weather and forecast data"""
+    global _pending_job, _inflight, _refresh_gen
+    _pending_job = None
+    if _inflight:
+        return  # Previous fetch still running
+    
     city = city_entry.get().strip()
     if not city:
         messagebox.showwarning("Input error", "Please enter a city name.")
         return
+    _inflight = True
+    _refresh_gen += 1
+    gen = _refresh_gen
+    if _ai_future:
+        _ai_future.cancel()  # No-op if it's already running; it'll be discarded instead
     
-    # Fetch both current weather and forecast
-    weather_result = get_weather()
-    forecast_result = get_forecast()
+    # Fetch current weather and forecast at the same time, render once both are in
+    weather_future = _executor.submit(get_weather, city, force)
+    forecast_future = _executor.submit(get_forecast, city, force)
+    _when_done([weather_future, forecast_future],
+               lambda: _show_results(city, weather_future, forecast_future, gen))
+
+def _show_results(city, weather_future, forecast_future, gen):
+    """Render fetched (error, data) results on the main thread and start the AI analysis"""
+    global _inflight, _ai_future
+    try:
+        weather_error, weather_data = weather_future.result()
+        forecast_error, forecast_data = forecast_future.result()
+        error = weather_error or forecast_error
+        if error:
+            messagebox.showerror("Network error", f"Could not reach server:\n{error}")
+        
+        weather_result = _render_current(weather_data, city) if weather_data else None
+        forecast_result = _render_forecast(forecast_data) if forecast_data else None
+    finally:
+        # Fetch and render are done; a new search may start while the AI runs
+        _inflight = False
     
-    # If both successful, run AI analysis
+    # If both successful, run AI analysis in the background so the UI stays responsive
     if weather_result and forecast_result:
-        ai_analysis = analyze_weather_with_ai(weather_result, forecast_result)
-        display_ai_analysis(ai_analysis)
+        display_ai_analysis("Analyzing weather data...")
+        ai_future = _ai_executor.submit(_analyze_if_current, gen, weather_result, forecast_result)
+        _ai_future = ai_future
+        # Picked up by main-thread polling; stops with the event loop if the window closes
+        _when_done([ai_future], lambda: _finish_refresh(ai_future, gen))
+
+def _analyze_if_current(gen, weather_data, forecast_data):
+    """Run the AI analysis unless a newer refresh has started (AI worker thread)"""
+    if gen != _refresh_gen:
+        return None  # Superseded: skip the Gemini call entirely
+    return analyze_weather_with_ai(weather_data, forecast_data)
+
+def _finish_refresh(ai_future, gen):
+    """Show the AI result unless it was cancelled or a newer refresh has started since"""
+    if ai_future.cancelled() or gen != _refresh_gen:
+        return
+    display_ai_analysis(ai_future.result())
 
 # ========== THEME SETTINGS ==========
 COLORS = {
@@ -161,29 +314,112 @@ def create_card(parent, row, col, rowspan=1, colspan=1, title=None):
                 
     return card
 
-def get_weather():
-    city = city_entry.get().strip()
-    if not city:
-        messagebox.showwarning("Input error", "Please enter a city name.")
-        return
+# Decoded icons ready for display: (icon_code, size) -> PIL image, filled by worker threads
+_icon_images = {}
+
+def _read_icon(icon_code, size):
+    """Read an OpenWeatherMap icon from ICON_DIR, downloading (then saving) it if missing.
+
+    Disk and network I/O only, so it runs on worker threads; returns a PIL image.
+    """
+    suffix = ICON_SUFFIXES.get(size, "@2x")
+    icon_path = os.path.join(ICON_DIR, f"{icon_code}{suffix}.png")
+    img = None
+    if os.path.exists(icon_path):
+        try:
+            img = Image.open(icon_path)
+            img.load()
+        except OSError:
+            # Damaged local copy: delete it and download a fresh one
+            img = None
+            try:
+                os.remove(icon_path)
+            except OSError:
+                pass
+    if img is None:
+        icon_url = f"https://openweathermap.org/img/wn/{icon_code}{suffix}.png"
+        icon_response = SESSION.get(icon_url, timeout=5)
+        image_data = icon_response.content
+        img = Image.open(BytesIO(image_data))
+        img.load()  # Only save icons that decode
+        try:
+            os.makedirs(ICON_DIR, exist_ok=True)
+            tmp_path = icon_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(image_data)
+            os.replace(tmp_path, icon_path)  # Never leaves a half-written icon behind
+        except OSError:
+            pass  # Read-only install: keep working from the network
+    if img.size != (size, size):  # Native sizes need no resampling
+        img = img.resize((size, size), Image.BILINEAR)
+    return img
+
+def _prefetch_icons(icon_codes, size):
+    """Load icons into _icon_images ahead of rendering (worker threads only, no Tk)"""
+    for icon_code in icon_codes:
+        if (icon_code, size) in _icon_images:
+            continue
+        try:
+            _icon_images[(icon_code, size)] = _read_icon(icon_code, size)
+        except (requests.exceptions.RequestException, OSError) as e:
+            print(f"Icon {icon_code} unavailable: {e}")  # Card falls back to text
+
+@functools.lru_cache(maxsize=64)
+def _load_icon(icon_code, size):
+    """Wrap a prefetched icon for Tk, cached per (code, size).
+
+    Never does I/O: raises KeyError if the worker stage couldn't load the icon.
+    Must only be called on the main thread after root = tk.Tk() exists.
+    """
+    return ImageTk.PhotoImage(_icon_images[(icon_code, size)])
+
+def _fetch_json(url, city, force=False):
+    """GET an OpenWeatherMap endpoint for a city and decode the JSON.
+
+    Runs on worker threads, so it never touches Tk: returns (error, data)
+    and leaves reporting the error to the main thread.
+    """
+    key = (city.lower(), url)
+    cached = _weather_cache.get(key)
+    if cached and not force and time.time() - cached[0] < CACHE_TTL:
+        return None, cached[1]
+    
     params = {
         "q": city,
         "appid": API_KEY,
         "units": "metric"
     }
     try:
-        response = requests.get(BASE_URL, params=params, timeout=5)
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("Network error", f"Could not reach server:\n{e}")
-        return
-
+        response = SESSION.get(url, params=params, timeout=5)
+        data = orjson.loads(response.content)  # Faster than the stdlib json parser
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        return e, None
+    
+    if str(data.get("cod")) == "200":  # Only cache successful responses
+        now = time.time()
+        # Drop expired entries so the cache doesn't grow with every city searched
+        for old_key, (ts, _) in list(_weather_cache.items()):
+            if now - ts >= CACHE_TTL:
+                _weather_cache.pop(old_key, None)
+        _weather_cache[key] = (now, data)
+    return None, data
+
+def get_weather(city, force=False):
+    """Fetch current weather (error, data) and its icon for a city (network only, safe off the main thread)"""
+    error, data = _fetch_json(BASE_URL, city, force)
+    if data and data.get("cod") == 200:
+        _prefetch_icons({w["icon"] for w in data.get("weather", [])[:1] if "icon" in w}, 100)
+    return error, data
+
+def _render_current(data, city):
+    """Update the current weather card and map from API data (main thread only)"""
     if data.get("cod") != 200:
         message = data.get("message", "Unknown error")
         messagebox.showerror("API error", f"Error from API:\n{message}")
         return
 
     # Extract Data
+    today_str = datetime.now().strftime("%A, %d %B %Y")
     city_name = data.get("name", city)
     main = data.get("main", {})
     weather_list = data.get("weather", [])
@@ -204,7 +440,7 @@ def get_weather():
     
     # Update UI Labels
     lbl_city.config(text=city_name)
-    lbl_date.config(text=datetime.now().strftime("%A, %d %B %Y"))
+    lbl_date.config(text=today_str)
     
     if temp is not None:
         lbl_temp.config(text=f"{int(temp)}°")
@@ -219,12 +455,7 @@ def get_weather():
     # Update Icon
     if icon_code:
         try:
-            icon_url = f"http://openweathermap.org/img/wn/{icon_code}@4x.png"
-            icon_response = requests.get(icon_url)
-            image_data = icon_response.content
-            img = Image.open(BytesIO(image_data))
-            img = img.resize((100, 100), Image.LANCZOS)
-            icon_img = ImageTk.PhotoImage(img)
+            icon_img = _load_icon(icon_code, 100)
             lbl_icon.config(image=icon_img)
             lbl_icon.image = icon_img
         except:
@@ -232,93 +463,98 @@ def get_weather():
 
     return data
 
-def get_forecast():
-    """Get and display 5-day weather forecast with detailed table"""
-    city = city_entry.get().strip()
-    if not city:
-        messagebox.showwarning("Input error", "Please enter a city name.")
-        return
-    
-    try:
-        url = "http://api.openweathermap.org/data/2.5/forecast"
-        params = {'q': city, 'appid': API_KEY, 'units': 'metric'}
+def get_forecast(city, force=False):
+    """Fetch 5-day forecast (error, data) and its icons for a city (network only, safe off the main thread)"""
+    error, data = _fetch_json(FORECAST_URL, city, force)
+    if data and str(data.get("cod")) == "200":
+        _prefetch_icons({w["icon"] for f in data.get("list", [])
+                         for w in f.get("weather", [])[:1] if "icon" in w}, 50)
+    return error, data
+
+def _render_forecast(data):
+    """Display 5-day forecast cards and detailed table (main thread only)"""
+    if str(data.get("cod")) == "200":
+        display_forecast(data)
+        display_forecast_table(data)  # New detailed table instead of graph
+        return data  # Return data for AI analysis
+    else:
+        messagebox.showerror("API error", data.get("message", "Could not fetch forecast"))
+        return None
+
+# Persistent day cards: (day_frame, day_lbl, icon_lbl, temp_lbl), built on first use
+FORECAST_CARDS = []
+
+def _build_forecast_cards():
+    """Create the 5 day-card widgets once; later refreshes only reconfigure them"""
+    for col_idx in range(5):
+        day_frame = tk.Frame(forecast_container, bg=COLORS["card_bg"], padx=5, pady=5)
+        day_frame.grid(row=0, column=col_idx, padx=5, sticky="ew")
         
-        response = requests.get(url, params=params, timeout=5)
-        data = response.json()
+        day_lbl = tk.Label(day_frame, font=("Segoe UI", 11), bg=COLORS["card_bg"], fg=COLORS["text_secondary"])
+        day_lbl.pack()
+        icon_lbl = tk.Label(day_frame, bg=COLORS["card_bg"], fg="white")
+        icon_lbl.pack()
+        temp_lbl = tk.Label(day_frame, font=("Segoe UI", 12, "bold"), bg=COLORS["card_bg"], fg=COLORS["text_main"])
+        temp_lbl.pack()
         
-        if response.status_code == 200:
-            display_forecast(data)
-            display_forecast_table(data)  # New detailed table instead of graph
-            return data  # Return data for AI analysis
-        else:
-            messagebox.showerror("API error", data.get("message", "Could not fetch forecast"))
-            return None
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("Network error", f"Could not reach server:\n{e}")
-        return None
+        FORECAST_CARDS.append((day_frame, day_lbl, icon_lbl, temp_lbl))
 
 def display_forecast(data):
     """Display 5-day forecast cards"""
-    # Clear existing cards
-    for widget in forecast_container.winfo_children():
-        widget.destroy()
+    if not FORECAST_CARDS:
+        _build_forecast_cards()
         
     # Group forecasts by day
     daily = {}
     for f in data['list']:
         d = f['dt_txt'].split(" ")[0]
         daily.setdefault(d, []).append(f)
+    days = list(daily.items())[:5]
     
-    # Create a card for each of the next 5 days
-    col_idx = 0
-    for date, forecasts in list(daily.items())[:5]:
+    # Fill a card for each of the next 5 days
+    for (day_frame, day_lbl, icon_lbl, temp_lbl), (date, forecasts) in zip(FORECAST_CARDS, days):
         mid = next((x for x in forecasts if "12:00:00" in x['dt_txt']), forecasts[len(forecasts)//2])
         
         temp = mid['main']['temp']
         icon = mid['weather'][0]['icon']
         
         date_obj = datetime.strptime(date, "%Y-%m-%d")
-        day_name = date_obj.strftime("%a") # Mon, Tue...
-        
-        # Day Card
-        day_frame = tk.Frame(forecast_container, bg=COLORS["card_bg"], padx=5, pady=5)
-        day_frame.grid(row=0, column=col_idx, padx=5, sticky="ew")
-        
-        tk.Label(day_frame, text=day_name, font=("Segoe UI", 11), bg=COLORS["card_bg"], fg=COLORS["text_secondary"]).pack()
+        day_lbl.config(text=date_obj.strftime("%a")) # Mon, Tue...
         
         # Try to load icon
         try:
-            icon_url = f"http://openweathermap.org/img/wn/{icon}@2x.png"
-            icon_response = requests.get(icon_url)
-            image_data = icon_response.content
-            img = Image.open(BytesIO(image_data))
-            img = img.resize((50, 50), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            icon_lbl = tk.Label(day_frame, image=photo, bg=COLORS["card_bg"])
+            photo = _load_icon(icon, 50)
+            icon_lbl.config(image=photo, text="")
             icon_lbl.image = photo
-            icon_lbl.pack()
         except:
-            tk.Label(day_frame, text="☁", bg=COLORS["card_bg"], fg="white").pack()
+            icon_lbl.config(image="", text="☁")
+            icon_lbl.image = None
             
-        tk.Label(day_frame, text=f"{int(temp)}°", font=("Segoe UI", 12, "bold"), bg=COLORS["card_bg"], fg=COLORS["text_main"]).pack()
-        
-        col_idx += 1
+        temp_lbl.config(text=f"{int(temp)}°")
+        day_frame.grid()
+    
+    # Hide cards without data (API returned fewer than 5 days)
+    for day_frame, *_ in FORECAST_CARDS[len(days):]:
+        day_frame.grid_remove()
 
 def display_forecast_table(data):
     """Update detail table with Dark Mode styling settings"""
     # Simply clear and repopulate the existing treeview
     # Note: Modern styling for Treeview requires ttk.Style
-    for item in table.get_children():
-        table.delete(item)
-        
-    for idx, f in enumerate(data['list'][:24]): # Next 72 hours approx
-        dt = datetime.fromtimestamp(f['dt']).strftime('%a %H:%M')
-        temp = f"{f['main']['temp']:.1f}"
-        weather = f['weather'][0]['description'].title()
-        wind = f"{f['wind']['speed']}"
-        humidity = f"{f['main']['humidity']}"
-        
-        table.insert("", "end", values=(dt, temp, weather, wind, humidity))
+    table.delete(*table.get_children())  # One Tcl call instead of one per row
+    
+    rows = [
+        (
+            datetime.fromtimestamp(f['dt']).strftime('%a %H:%M'),
+            f"{f['main']['temp']:.1f}",
+            f['weather'][0]['description'].title(),
+            f"{f['wind']['speed']}",
+            f"{f['main']['humidity']}",
+        )
+        for f in data['list'][:24]  # Next 72 hours approx
+    ]
+    for row in rows:
+        table.insert("", "end", values=row)
 
 def display_ai_analysis(ai_text):
     text_widget.config(state=tk.NORMAL)
@@ -361,10 +597,12 @@ search_frame.pack(side="right")
 city_entry = tk.Entry(search_frame, bg="#2c3340", fg="white", font=("Segoe UI", 11), borderwidth=0, width=25)
 city_entry.pack(side="left", padx=5)
 city_entry.insert(0, "Bangalore")
-city_entry.bind('<Return>', lambda e: get_all_data())
+city_entry.bind('<Return>', _schedule_refresh)
+city_entry.bind('<Shift-Return>', _force_refresh)
 
-btn_search = tk.Button(search_frame, text="🔍", command=get_all_data, 
+btn_search = tk.Button(search_frame, text="🔍", command=_schedule_refresh, 
                       bg="#2c3340", fg="white", bd=0, activebackground="#2c3340", activeforeground=COLORS["accent"])
+btn_search.bind('<Shift-Button-1>', _force_refresh)
 btn_search.pack(side="left")
 
 # --- MAIN SCROLLABLE AREA ---
@@ -447,7 +685,7 @@ map_widget.pack(fill="both", expand=True, ipady=100) # ipady adds height
 forecast_area = create_card(scrollable_frame, 1, 0, colspan=2, title="Daily Forecast")
 forecast_container = tk.Frame(forecast_area, bg=COLORS["card_bg"])
 forecast_container.pack(fill="x")
-# We'll pack day-cards into this forecast_container dynamically
+# Day cards are created on the first refresh and reused afterwards
 
 # 4. HOURLY GRID & AI ADVICE (Bottom)
 # Split bottom row: Left=Table, Right=AI
@@ -489,3 +727,8 @@ text_widget.pack(side="left", fill="both", expand=True)
 ai_scrollbar.config(command=text_widget.yview)
 
 root.mainloop()
+
+# Drop queued background work after the window closes. A request that is already
+# running (e.g. a Gemini call, up to AI_TIMEOUT) still finishes before the process exits.
+_executor.shutdown(wait=False, cancel_futures=True)
+_ai_executor.shutdown(wait=False, cancel_futures=True)